@@ -0,0 +1,19 @@
+import os
+
+import torch
+
+
+def _num_cpus():
+    # Respect CPU affinity (e.g. cpuset limits on CI runners) where the platform exposes it.
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def pytest_configure(config):
+    # When the tests are distributed with pytest-xdist, split the CPUs between the workers,
+    # so that their intra-op thread pools do not oversubscribe the CPUs.
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is None:
+        return
+    torch.set_num_threads(max(1, _num_cpus() // workerinput['workercount']))
@@ -70,6 +70,7 @@ def get_whitenoise(
         torch.random.manual_seed(seed)
         tensor = torch.randn([n_channels, int(sample_rate * duration)],
                              dtype=torch.float32, device='cpu')
+    tensor = tensor.to(device)
     tensor /= 2.0
     tensor *= scale_factor
     tensor.clamp_(-1.0, 1.0)
@@ -137,7 +138,7 @@ def get_spectrogram(
     """
     hop_length = hop_length or n_fft // 4
     win_length = win_length or n_fft
-    window = torch.hann_window(win_length) if window is None else window
+    window = torch.hann_window(win_length, device=waveform.device) if window is None else window
     spec = torch.stft(
         waveform,
         n_fft=n_fft,
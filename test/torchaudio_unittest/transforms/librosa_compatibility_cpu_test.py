@@ -0,0 +1,6 @@
+from torchaudio_unittest.common_utils import PytorchTestCase
+from .librosa_compatibility_test_impl import Transforms
+
+
+class TestTransformsCPU(Transforms, PytorchTestCase):
+    device = 'cpu'
@@ -0,0 +1,7 @@
+from torchaudio_unittest.common_utils import PytorchTestCase, skipIfNoCuda
+from .librosa_compatibility_test_impl import Transforms
+
+
+@skipIfNoCuda
+class TestTransformsCUDA(Transforms, PytorchTestCase):
+    device = 'cuda'
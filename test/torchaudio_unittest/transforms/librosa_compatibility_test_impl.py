@@ -0,0 +1,257 @@
+"""Test suites for numerical compatibility with librosa"""
+import hashlib
+import os
+import unittest
+
+import torch
+import torchaudio
+import torchaudio.functional as F
+from torchaudio._internal.module_utils import is_module_available
+from parameterized import parameterized, param
+
+LIBROSA_AVAILABLE = is_module_available('librosa')
+
+if LIBROSA_AVAILABLE:
+    import numpy as np
+    import librosa
+    import scipy.fft
+
+from torchaudio_unittest import common_utils
+
+
+# Results of librosa functions, keyed by the function and its arguments.
+# Only the reference values shared by multiple test cases (spectrogram, mel spectrogram of the
+# test signal and their dB conversion) go through this, so that they are computed only once.
+_LIBROSA_RESULTS = {}
+
+
+def _to_key(value):
+    if isinstance(value, np.ndarray):
+        return value.dtype.str, value.shape, hashlib.sha1(value.tobytes()).hexdigest()
+    return value
+
+
+def _librosa(func, **kwargs):
+    """Call librosa function with the given keyword arguments, reusing the result of an identical call.
+
+    The returned value is shared across calls, so it must not be modified in-place.
+    """
+    key = (func.__module__, func.__name__) + tuple((k, _to_key(v)) for k, v in sorted(kwargs.items()))
+    if key not in _LIBROSA_RESULTS:
+        _LIBROSA_RESULTS[key] = func(**kwargs)
+    return _LIBROSA_RESULTS[key]
+
+
+def _load_audio_asset(*asset_paths, **kwargs):
+    file_path = common_utils.get_asset_path(*asset_paths)
+    sound, sample_rate = torchaudio.load(file_path, **kwargs)
+    return sound, sample_rate
+
+
+@unittest.skipIf(not LIBROSA_AVAILABLE, "Librosa not available")
+class Transforms(common_utils.TestBaseMixin):
+    """Test suite for functions in `transforms` module."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The input signal is identical across test cases, so generate it only once.
+        # The NumPy array is a view of the CPU tensor, which is also used as-is when testing on CPU.
+        sinusoid = common_utils.get_sinusoid(n_channels=1, sample_rate=16000)
+        cls._sinusoid_16k_np = sinusoid[0].numpy()
+        cls._sinusoid_16k = sinusoid.to(cls.device)
+        # Windows only depend on their length, so share them across transforms.
+        cls._windows = {}
+        # dB conversions do not depend on test case parameters.
+        cls._power_to_db = torchaudio.transforms.AmplitudeToDB('power', 80.).to(cls.device)
+        cls._mag_to_db = torchaudio.transforms.AmplitudeToDB('magnitude', 80.).to(cls.device)
+
+    @classmethod
+    def _hann_window(cls, win_length):
+        if win_length not in cls._windows:
+            cls._windows[win_length] = torch.hann_window(win_length, device=cls.device)
+        return cls._windows[win_length]
+
+    @parameterized.expand([
+        param(n_fft=400, hop_length=200, power=2.0),
+        param(n_fft=600, hop_length=100, power=2.0),
+        param(n_fft=400, hop_length=200, power=3.0),
+        param(n_fft=200, hop_length=50, power=2.0),
+    ])
+    def test_spectrogram(self, n_fft, hop_length, power):
+        sound = self._sinusoid_16k
+        sound_librosa = self._sinusoid_16k_np
+        spect_transform = torchaudio.transforms.Spectrogram(
+            n_fft=n_fft, hop_length=hop_length, power=power, window_fn=self._hann_window).to(self.device)
+        out_librosa, _ = _librosa(
+            librosa.core.spectrum._spectrogram,
+            y=sound_librosa, n_fft=n_fft, hop_length=hop_length, power=power)
+
+        out_torch = spect_transform(sound).squeeze().cpu()
+        self.assertEqual(out_torch, torch.as_tensor(out_librosa), atol=1e-5, rtol=1e-5)
+
+    def test_spectrogram_complex(self):
+        n_fft = 400
+        hop_length = 200
+        sound = self._sinusoid_16k
+        sound_librosa = self._sinusoid_16k_np
+        spect_transform = torchaudio.transforms.Spectrogram(
+            n_fft=n_fft, hop_length=hop_length, power=None, return_complex=True,
+            window_fn=self._hann_window).to(self.device)
+        out_librosa = librosa.stft(y=sound_librosa, n_fft=n_fft, hop_length=hop_length, pad_mode='reflect')
+
+        out_torch = spect_transform(sound).squeeze().cpu()
+        self.assertEqual(out_torch, torch.as_tensor(out_librosa), atol=1e-5, rtol=1e-5)
+
+    @common_utils.nested_params(
+        [
+            param(n_fft=400, hop_length=200, n_mels=128),
+            param(n_fft=600, hop_length=100, n_mels=128),
+            param(n_fft=200, hop_length=50, n_mels=128),
+        ],
+        [param(norm=n) for n in [None, 'slaney']],
+        [param(mel_scale=s) for s in ['htk', 'slaney']],
+    )
+    def test_mel_spectrogram(self, n_fft, hop_length, n_mels, norm, mel_scale):
+        sample_rate = 16000
+        sound = self._sinusoid_16k
+        sound_librosa = self._sinusoid_16k_np
+        melspect_transform = torchaudio.transforms.MelSpectrogram(
+            sample_rate=sample_rate, window_fn=self._hann_window,
+            hop_length=hop_length, n_mels=n_mels, n_fft=n_fft, norm=norm, mel_scale=mel_scale).to(self.device)
+        librosa_mel = _librosa(
+            librosa.feature.melspectrogram,
+            y=sound_librosa, sr=sample_rate, n_fft=n_fft,
+            hop_length=hop_length, n_mels=n_mels, htk=mel_scale == "htk", norm=norm)
+        librosa_mel_tensor = torch.as_tensor(librosa_mel)
+        torch_mel = melspect_transform(sound).squeeze().cpu()
+        self.assertEqual(torch_mel, librosa_mel_tensor, atol=5e-3, rtol=1e-5, exact_dtype=False)
+
+    @common_utils.nested_params(
+        [
+            param(n_fft=400, hop_length=200, power=2.0, n_mels=128),
+            param(n_fft=600, hop_length=100, power=2.0, n_mels=128),
+            param(n_fft=400, hop_length=200, power=3.0, n_mels=128),
+            # NOTE: Test passes offline, but fails on TravisCI (and CircleCI), see #372.
+            param(n_fft=200, hop_length=50, power=2.0, n_mels=128, skip_ci=True),
+        ],
+        [param(norm=n) for n in [None, 'slaney']],
+        [param(mel_scale=s) for s in ['htk', 'slaney']],
+    )
+    def test_s2db(self, n_fft, hop_length, power, n_mels, norm, mel_scale, skip_ci=False):
+        if skip_ci and 'CI' in os.environ:
+            self.skipTest('Test is known to fail on CI')
+        sample_rate = 16000
+        sound = self._sinusoid_16k
+        sound_librosa = self._sinusoid_16k_np
+        # Compute the STFT only once. Both the spectrogram of the given power and
+        # the mel spectrogram (which is computed from the power 2 spectrogram) are derived from it.
+        spect_transform = torchaudio.transforms.Spectrogram(
+            n_fft=n_fft, hop_length=hop_length, power=1., window_fn=self._hann_window).to(self.device)
+        mel_scale_transform = torchaudio.transforms.MelScale(
+            n_mels=n_mels, sample_rate=sample_rate, n_stft=n_fft // 2 + 1,
+            norm=norm, mel_scale=mel_scale).to(self.device)
+        magnitude = spect_transform(sound)
+        spec = magnitude.pow(power)
+        melspec = mel_scale_transform(magnitude.pow(2.))
+        out_librosa, _ = _librosa(
+            librosa.core.spectrum._spectrogram,
+            y=sound_librosa, n_fft=n_fft, hop_length=hop_length, power=power)
+        librosa_mel = _librosa(
+            librosa.feature.melspectrogram,
+            y=sound_librosa, sr=sample_rate, n_fft=n_fft,
+            hop_length=hop_length, n_mels=n_mels, htk=mel_scale == "htk", norm=norm)
+
+        power_to_db_torch = self._power_to_db(spec).squeeze().cpu()
+        power_to_db_librosa = _librosa(librosa.core.spectrum.power_to_db, S=out_librosa)
+        self.assertEqual(power_to_db_torch, torch.as_tensor(power_to_db_librosa), atol=5e-3, rtol=1e-5)
+
+        power_to_db_torch = self._power_to_db(melspec).squeeze().cpu()
+        db_librosa = _librosa(librosa.core.spectrum.power_to_db, S=librosa_mel)
+        db_librosa_tensor = torch.as_tensor(db_librosa)
+        self.assertEqual(power_to_db_torch, db_librosa_tensor, atol=5e-3, rtol=1e-5, exact_dtype=False)
+
+    def test_mag2db(self):
+        # Magnitude to dB conversion does not depend on the spectrogram parameters of test_s2db,
+        # so it is tested once, on the waveform.
+        sound = self._sinusoid_16k
+        sound_librosa = self._sinusoid_16k_np
+        mag_to_db_torch = self._mag_to_db(torch.abs(sound)).squeeze().cpu()
+        mag_to_db_librosa = librosa.core.spectrum.amplitude_to_db(sound_librosa)
+        self.assertEqual(mag_to_db_torch, torch.as_tensor(mag_to_db_librosa), atol=5e-3, rtol=1e-5)
+
+    @parameterized.expand([
+        param(n_fft=400, hop_length=200, n_mels=128, n_mfcc=40),
+        param(n_fft=600, hop_length=100, n_mels=128, n_mfcc=20),
+        param(n_fft=200, hop_length=50, n_mels=128, n_mfcc=50),
+    ])
+    def test_mfcc(self, n_fft, hop_length, n_mels, n_mfcc):
+        sample_rate = 16000
+        sound = self._sinusoid_16k
+        sound_librosa = self._sinusoid_16k_np
+        librosa_mel = _librosa(
+            librosa.feature.melspectrogram,
+            y=sound_librosa, sr=sample_rate, n_fft=n_fft,
+            hop_length=hop_length, n_mels=n_mels, htk=True, norm=None)
+        db_librosa = _librosa(librosa.core.spectrum.power_to_db, S=librosa_mel)
+
+        # librosa.feature.mfcc doesn't pass kwargs properly since some of the
+        # kwargs for melspectrogram and mfcc are the same. We just follow the
+        # function body in
+        # https://librosa.github.io/librosa/_modules/librosa/feature/spectral.html#melspectrogram
+        # to mirror this function call with correct args:
+        #
+        # librosa_mfcc = librosa.feature.mfcc(
+        #     y=sound_librosa, sr=sample_rate, n_mfcc = n_mfcc,
+        #     hop_length=hop_length, n_fft=n_fft, htk=True, norm=None, n_mels=n_mels)
+
+        librosa_mfcc = scipy.fft.dct(db_librosa, axis=0, type=2, norm='ortho')[:n_mfcc]
+        librosa_mfcc_tensor = torch.as_tensor(librosa_mfcc)
+
+        melkwargs = {'hop_length': hop_length, 'n_fft': n_fft, 'window_fn': self._hann_window}
+        mfcc_transform = torchaudio.transforms.MFCC(
+            sample_rate=sample_rate, n_mfcc=n_mfcc, norm='ortho', melkwargs=melkwargs).to(self.device)
+        torch_mfcc = mfcc_transform(sound).squeeze().cpu()
+
+        self.assertEqual(torch_mfcc, librosa_mfcc_tensor, atol=5e-3, rtol=1e-5, exact_dtype=False)
+
+    @parameterized.expand([
+        param(n_fft=400, hop_length=200),
+        param(n_fft=600, hop_length=100),
+        param(n_fft=200, hop_length=50),
+    ])
+    def test_spectral_centroid(self, n_fft, hop_length):
+        sample_rate = 16000
+        sound = self._sinusoid_16k
+        sound_librosa = self._sinusoid_16k_np
+        spect_centroid = torchaudio.transforms.SpectralCentroid(
+            sample_rate=sample_rate, n_fft=n_fft, hop_length=hop_length,
+            window_fn=self._hann_window).to(self.device)
+        out_torch = spect_centroid(sound).squeeze().cpu()
+
+        out_librosa = librosa.feature.spectral_centroid(
+            y=sound_librosa, sr=sample_rate, n_fft=n_fft, hop_length=hop_length)
+        out_librosa = torch.as_tensor(out_librosa)[0]
+
+        self.assertEqual(out_torch, out_librosa, atol=1e-5, rtol=1e-5, exact_dtype=False)
+
+    def test_MelScale(self):
+        """MelScale transform is comparable to that of librosa"""
+        n_fft = 2048
+        n_mels = 256
+        hop_length = n_fft // 4
+        sample_rate = 44100
+        sound = common_utils.get_whitenoise(sample_rate=sample_rate, duration=5, device=self.device)
+        spec_ta = F.spectrogram(
+            sound, pad=0, window=self._hann_window(n_fft), n_fft=n_fft,
+            hop_length=hop_length, win_length=n_fft, power=2, normalized=False)
+        spec_lr = spec_ta.cpu().numpy().squeeze()
+        # Perform MelScale with torchaudio and librosa
+        mel_scale_transform = torchaudio.transforms.MelScale(
+            n_mels=n_mels, sample_rate=sample_rate).to(self.device)
+        melspec_ta = mel_scale_transform(spec_ta).cpu()
+        melspec_lr = librosa.feature.melspectrogram(
+            S=spec_lr, sr=sample_rate, n_fft=n_fft, hop_length=hop_length,
+            win_length=n_fft, center=True, window='hann', n_mels=n_mels, htk=True, norm=None)
+        # Note: Using relaxed rtol instead of atol
+        self.assertEqual(melspec_ta, torch.as_tensor(melspec_lr[None, ...]), atol=1e-8, rtol=1e-3)